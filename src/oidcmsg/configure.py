@@ -237,8 +237,8 @@ def create_from_config_file(cls,
         """Load configuration as YAML"""
         _cnf = load_yaml_config(filename)
     elif filename.endswith(".json"):
-        _str = open(filename).read()
-        _cnf = json.loads(_str)
+        with open(filename, "rb") as fp:
+            _cnf = json.load(fp)
     elif filename.endswith(".py"):
         head, tail = os.path.split(filename)
         tail = tail[:-3]
@@ -32,20 +32,19 @@ class OidcContext(ImpExp):
 
     def _keyjar(self, keyjar=None, conf=None, entity_id=""):
         if keyjar is None:
-            if "keys" in conf:
-                keys_args = {k: v for k, v in conf["keys"].items() if k != "uri_path"}
-                _keyjar = init_key_jar(**keys_args)
-            elif "key_conf" in conf:
-                keys_args = {k: v for k, v in conf["key_conf"].items() if k != "uri_path"}
+            _key_conf = conf.get("keys", conf.get("key_conf"))
+            if _key_conf is not None:
+                keys_args = {k: v for k, v in _key_conf.items() if k != "uri_path"}
                 _keyjar = init_key_jar(**keys_args)
             else:
                 _keyjar = KeyJar()
-                if "jwks" in conf:
-                    _keyjar.import_jwks(conf["jwks"], "")
+                _jwks = conf.get("jwks")
+                if _jwks is not None:
+                    _keyjar.import_jwks(_jwks, "")
 
             if "" in _keyjar and entity_id:
                 # make sure I have the keys under my own name too (if I know it)
-                _keyjar.import_jwks_as_json(_keyjar.export_jwks_as_json(True, ""), entity_id)
+                _keyjar.import_jwks(_keyjar.export_jwks(True, ""), entity_id)
 
             _httpc_params = conf.get("httpc_params")
             if _httpc_params:
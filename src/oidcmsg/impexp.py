@@ -99,7 +99,7 @@ class ImpExp:
             else:
                 val = item
         elif cls == "DICT_TYPE":
-            if list(item.keys()) == ["DICT_TYPE"]:
+            if item.keys() == {"DICT_TYPE"}:
                 _spec = item["DICT_TYPE"]
                 val = importer(_spec["class"])(**_spec["kwargs"])
             else:
@@ -119,7 +119,7 @@ class ImpExp:
 
             val = [_cls(**_args).load(v, **_kwargs) for v in item]
         elif issubclass(cls, Message):
-            _cls_name = list(item.keys())[0]
+            _cls_name = next(iter(item))
             _cls = importer(_cls_name)
             val = _cls().from_dict(item[_cls_name])
         else:
@@ -1,4 +1,5 @@
 import copy
+import inspect
 import json
 import logging
 from collections.abc import MutableMapping
@@ -462,21 +463,14 @@ class Message(MutableMapping):
         key = []
 
         if keyjar:
-            _keys = keyjar.get_jwt_verify_keys(jwt, **kwargs)
-            if not _keys:
+            key = keyjar.get_jwt_verify_keys(jwt, **kwargs)
+            if not key:
+                # One refresh is enough, doing it again will not give a different result
                 keyjar.update()
-                _keys = keyjar.get_jwt_verify_keys(jwt, **kwargs)
-            key.extend(_keys)
+                key = keyjar.get_jwt_verify_keys(jwt, **kwargs)
 
-        if "alg" in header and header["alg"] != "none":
-            if not key:
-                if keyjar:
-                    keyjar.update()
-                    key = keyjar.get_jwt_verify_keys(jwt, **kwargs)
-                    if not key:
-                        raise MissingSigningKey("alg=%s" % header["alg"])
-                else:
-                    raise MissingSigningKey("alg=%s" % header["alg"])
+        if not key and header.get("alg", "none") != "none":
+            raise MissingSigningKey("alg=%s" % header["alg"])
 
         return key
 
@@ -581,36 +575,27 @@ class Message(MutableMapping):
         Make sure all the required values are there and that the values are
         of the correct type
         """
-        _spec = self.c_param
-        try:
-            _allowed = self.c_allowed_values
-        except KeyError:
-            _allowed = {}
+        _dict = self._dict
+        _allowed = self.c_allowed_values
 
-        for (attribute, (typ, required, _, _, na)) in _spec.items():
+        for (attribute, (typ, required, _, _, na)) in self.c_param.items():
             if attribute == "*":
                 continue
 
-            try:
-                val = self._dict[attribute]
-            except KeyError:
+            # Most specified parameters are absent, so test for that first
+            if attribute not in _dict:
                 if required:
                     raise MissingRequiredAttribute("%s" % attribute)
                 continue
-            else:
-                if typ == bool:
-                    pass
-                elif not val:
-                    if required:
-                        raise MissingRequiredAttribute("%s" % attribute)
-                    continue
 
-            try:
-                _allowed_val = _allowed[attribute]
-            except KeyError:
-                pass
-            else:
-                if not self._type_check(typ, _allowed_val, val, na):
+            val = _dict[attribute]
+            if not val and typ != bool:
+                if required:
+                    raise MissingRequiredAttribute("%s" % attribute)
+                continue
+
+            if attribute in _allowed:
+                if not self._type_check(typ, _allowed[attribute], val, na):
                     raise NotAllowedValue(val)
 
         return True
@@ -735,7 +720,7 @@ class Message(MutableMapping):
         :return: The key,value pairs for keys that are not in the c_params
             specification,
         """
-        return dict([(key, val) for key, val in self._dict.items() if key not in self.c_param])
+        return {key: val for key, val in self._dict.items() if key not in self.c_param}
 
     def only_extras(self):
         """
@@ -744,11 +729,7 @@ class Message(MutableMapping):
 
         :return: True/False
         """
-        known = [key for key in self._dict.keys() if key in self.c_param]
-        if not known:
-            return True
-        else:
-            return False
+        return not any(key in self.c_param for key in self._dict)
 
     def update(self, item, **kwargs):
         """
@@ -839,8 +820,33 @@ class Message(MutableMapping):
 # =============================================================================
 
 
+# Module name to a dictionary of the Message classes found in that module
+_MESSAGE_CLASS_INDEX = {}
+
+
+def message_class_index(module):
+    """
+    Return a dictionary mapping class names to the Message classes in a module.
+
+    The index is built on first use. It is filled in completely before it is
+    stored, so concurrent callers never see a partial index.
+
+    :param module: The module to look for Message classes in
+    :return: A dictionary with class name as key and class as value
+    """
+    _index = _MESSAGE_CLASS_INDEX.get(module.__name__)
+    if _index is None:
+        _index = {}
+        for name, obj in inspect.getmembers(module):
+            if inspect.isclass(obj) and issubclass(obj, Message):
+                _index.setdefault(obj.__name__, obj)
+        _MESSAGE_CLASS_INDEX[module.__name__] = _index
+
+    return _index
+
+
 def by_schema(cls, **kwa):
-    return dict([(key, val) for key, val in kwa.items() if key in cls.c_param])
+    return {key: val for key, val in kwa.items() if key in cls.c_param}
 
 
 def add_non_standard(msg1, msg2):
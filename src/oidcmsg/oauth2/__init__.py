@@ -1,4 +1,3 @@
-import inspect
 import logging
 import string
 import sys
@@ -17,6 +16,7 @@ from oidcmsg.message import SINGLE_REQUIRED_BOOLEAN
 from oidcmsg.message import SINGLE_REQUIRED_INT
 from oidcmsg.message import SINGLE_REQUIRED_STRING
 from oidcmsg.message import Message
+from oidcmsg.message import message_class_index
 
 logger = logging.getLogger(__name__)
 
@@ -351,12 +351,11 @@ class JWTSecuredAuthorizationRequest(AuthorizationRequest):
             if _vc_name in self:
                 del self[_vc_name]
 
-            args = {}
-            for arg in ["keyjar", "opponent_id", "sender", "alg", "encalg", "encenc"]:
-                try:
-                    args[arg] = kwargs[arg]
-                except KeyError:
-                    pass
+            args = {
+                arg: kwargs[arg]
+                for arg in ["keyjar", "opponent_id", "sender", "alg", "encalg", "encenc"]
+                if arg in kwargs
+            }
 
             _req = AuthorizationRequest().from_jwt(str(self["request"]), **args)
             self.merge(_req, "strict")
@@ -377,12 +376,11 @@ class PushedAuthorizationRequest(AuthorizationRequest):
             if _vc_name in self:
                 del self[_vc_name]
 
-            args = {}
-            for arg in ["keyjar", "opponent_id", "sender", "alg", "encalg", "encenc"]:
-                try:
-                    args[arg] = kwargs[arg]
-                except KeyError:
-                    pass
+            args = {
+                arg: kwargs[arg]
+                for arg in ["keyjar", "opponent_id", "sender", "alg", "encalg", "encenc"]
+                if arg in kwargs
+            }
 
             _req = AuthorizationRequest().from_jwt(str(self["request"]), **args)
             self.merge(_req, "lax")
@@ -414,10 +412,6 @@ def factory(msgtype, **kwargs):
     :return: An instance of the class or None if the name doesn't match any
         known class.
     """
-    for name, obj in inspect.getmembers(sys.modules[__name__]):
-        if inspect.isclass(obj) and issubclass(obj, Message):
-            try:
-                if obj.__name__ == msgtype:
-                    return obj(**kwargs)
-            except AttributeError:
-                pass
+    _cls = message_class_index(sys.modules[__name__]).get(msgtype)
+    if _cls:
+        return _cls(**kwargs)
@@ -1,5 +1,4 @@
 # encoding: utf-8
-import inspect
 import json
 import logging
 import sys
@@ -37,6 +36,7 @@ from oidcmsg.message import SINGLE_OPTIONAL_JSON
 from oidcmsg.message import SINGLE_OPTIONAL_STRING
 from oidcmsg.message import SINGLE_REQUIRED_STRING
 from oidcmsg.message import Message
+from oidcmsg.message import message_class_index
 from oidcmsg.message import msg_ser
 from oidcmsg.oauth2 import ResponseMessage
 from oidcmsg.time_util import utc_time_sans_frac
@@ -217,15 +217,15 @@ SINGLE_OPTIONAL_DICT = (dict, False, msg_ser_json, dict_deser, False)
 # ----------------------------------------------------------------------------
 
 
-SCOPE_CHARSET = []
+SCOPE_CHARSET = set()
 for char in ["\x21", ("\x23", "\x5b"), ("\x5d", "\x7E")]:
     if isinstance(char, tuple):
         c = char[0]
         while c <= char[1]:
-            SCOPE_CHARSET.append(c)
+            SCOPE_CHARSET.add(c)
             c = chr(ord(c) + 1)
     else:
-        SCOPE_CHARSET.append(set)
+        SCOPE_CHARSET.add(char)
 
 
 def check_char_set(string, allowed):
@@ -276,18 +276,14 @@ class TokenErrorResponse(oauth2.TokenErrorResponse):
 
 def verify_id_token(msg, check_hash=False, claim="id_token", **kwargs):
     # Try to decode the JWT, checks the signature
-    args = {}
-    for arg in ID_TOKEN_VERIFY_ARGS:
-        try:
-            args[arg] = kwargs[arg]
-        except KeyError:
-            pass
+    args = {arg: kwargs[arg] for arg in ID_TOKEN_VERIFY_ARGS if arg in kwargs}
 
     _jws = jws_factory(msg[claim])
     if not _jws:
         raise ValueError("{} not a signed JWT".format(claim))
 
-    if _jws.jwt.headers["alg"] == "none":
+    _header = _jws.jwt.headers
+    if _header["alg"] == "none":
         _signed = False
         _sign_alg = kwargs.get("sigalg")
         if _sign_alg == "none":
@@ -299,18 +295,19 @@ def verify_id_token(msg, check_hash=False, claim="id_token", **kwargs):
     else:
         _signed = True
         if "allowed_sign_alg" in kwargs:
-            if _jws.jwt.headers["alg"] != kwargs["allowed_sign_alg"]:
+            if _header["alg"] != kwargs["allowed_sign_alg"]:
                 _msg = "Wrong token signing algorithm, {} != {}".format(
-                    _jws.jwt.headers["alg"], kwargs["allowed_sign_alg"]
+                    _header["alg"], kwargs["allowed_sign_alg"]
                 )
                 logger.error(_msg)
                 raise UnsupportedAlgorithm(_msg)
 
-    _body = _jws.jwt.payload()
     if _signed and "keyjar" in kwargs:
+        # The payload is only needed here, from_jwt() below does its own decoding
+        _body = _jws.jwt.payload()
         try:
             if _body["iss"] not in kwargs["keyjar"]:
-                logger.info("KeyJar issuers: {}".format(kwargs["keyjar"]))
+                logger.info("KeyJar issuers: %s", kwargs["keyjar"])
                 raise ValueError('Unknown issuer: "{}"'.format(_body["iss"]))
         except KeyError:
             raise MissingRequiredAttribute("iss")
@@ -336,7 +333,7 @@ def verify_id_token(msg, check_hash=False, claim="id_token", **kwargs):
                 raise CHashError("Failed to verify code hash", idt)
 
     msg[verified_claim_name(claim)] = idt
-    logger.info("Verified {}: {}".format(claim, idt.to_dict()))
+    logger.info("Verified %s: %s", claim, idt)
 
     return True
 
@@ -456,12 +453,11 @@ class AuthorizationRequest(oauth2.AuthorizationRequest):
 
         clear_verified_claims(self)
 
-        args = {}
-        for arg in ["keyjar", "opponent_id", "sender", "alg", "encalg", "encenc"]:
-            try:
-                args[arg] = kwargs[arg]
-            except KeyError:
-                pass
+        args = {
+            arg: kwargs[arg]
+            for arg in ["keyjar", "opponent_id", "sender", "alg", "encalg", "encenc"]
+            if arg in kwargs
+        }
 
         if "opponent_id" not in kwargs:
             args["opponent_id"] = self["client_id"]
@@ -476,7 +472,7 @@ class AuthorizationRequest(oauth2.AuthorizationRequest):
                     if key in self:
                         if self[key] != val:
                             # log but otherwise ignore
-                            logger.warning("{} != {}".format(self[key], val))
+                            logger.warning("%s != %s", self[key], val)
 
                 # remove all claims
                 _keys = list(self.keys())
@@ -807,10 +803,7 @@ class IdToken(OpenIDSchema):
 
         _now = time_util.utc_time_sans_frac()
 
-        try:
-            _skew = kwargs["skew"]
-        except KeyError:
-            _skew = 0
+        _skew = kwargs.get("skew", 0)
 
         try:
             _exp = self["exp"]
@@ -820,10 +813,7 @@ class IdToken(OpenIDSchema):
             if (_now - _skew) > _exp:
                 raise EXPError("Invalid expiration time")
 
-        try:
-            _storage_time = kwargs["nonce_storage_time"]
-        except KeyError:
-            _storage_time = NONCE_STORAGE_TIME
+        _storage_time = kwargs.get("nonce_storage_time", NONCE_STORAGE_TIME)
 
         try:
             _iat = self["iat"]
@@ -980,10 +970,7 @@ class JsonWebToken(Message):
 
         _now = utc_time_sans_frac()
 
-        try:
-            _skew = kwargs["skew"]
-        except KeyError:
-            _skew = 0
+        _skew = kwargs.get("skew", 0)
 
         try:
             _exp = self["exp"]
@@ -1160,13 +1147,9 @@ class ClaimsRequest(Message):
 
 
 def factory(msgtype, **kwargs):
-    for name, obj in inspect.getmembers(sys.modules[__name__]):
-        if inspect.isclass(obj) and issubclass(obj, Message):
-            try:
-                if obj.__name__ == msgtype:
-                    return obj(**kwargs)
-            except AttributeError:
-                pass
+    _cls = message_class_index(sys.modules[__name__]).get(msgtype)
+    if _cls:
+        return _cls(**kwargs)
 
     # Fall back to basic OAuth2 messages
     return oauth2.factory(msgtype, **kwargs)
@@ -1230,7 +1213,7 @@ def claims_match(value, claimspec):
             break
 
     # No values to test against so it's just about being there or not
-    if list(claimspec.keys()) == ["essential"]:
+    if claimspec.keys() == {"essential"}:
         return True
 
     return matched
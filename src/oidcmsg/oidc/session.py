@@ -16,7 +16,6 @@ from ..message import Message
 from ..oauth2 import ResponseMessage
 from ..oidc import ID_TOKEN_VERIFY_ARGS
 from ..oidc import SINGLE_OPTIONAL_IDTOKEN
-from ..oidc import IdToken
 from ..oidc import MessageWithIdToken
 from ..oidc import clear_verified_claims
 from ..oidc import verified_claim_name
@@ -61,18 +60,10 @@ class EndSessionRequest(Message):
                 return False
 
         if "id_token_hint" in self:
-            # Try to decode the JWT, checks the signature
-            args = {}
-            for arg in ID_TOKEN_VERIFY_ARGS:
-                try:
-                    args[arg] = kwargs[arg]
-                except KeyError:
-                    pass
-            idt = IdToken().from_jwt(str(self["id_token_hint"]), **args)
+            # Decodes the JWT, checks the signature and adds the verified
+            # ID Token to the message instance
             if not verify_id_token(self, claim="id_token_hint", **kwargs):
                 return False
-            # Add the verified ID Token to the message instance
-            self[verified_claim_name("id_token_hint")] = idt
 
         return True
 
@@ -105,12 +96,12 @@ class LogoutToken(Message):
             raise MessageException('"nonce" is prohibited from appearing in ' "a LogoutToken.")
 
         # Check the 'events' JSON
-        _keys = list(self["events"].keys())
-        if len(_keys) != 1:
+        _events = self["events"]
+        if len(_events) != 1:
             raise ValueError('Must only be one member in "events"')
-        if _keys[0] != "http://schemas.openid.net/event/backchannel-logout":
+        if BACK_CHANNEL_LOGOUT_EVENT not in _events:
             raise ValueError('Wrong member in "events"')
-        if self["events"][_keys[0]] != {}:
+        if _events[BACK_CHANNEL_LOGOUT_EVENT] != {}:
             raise ValueError('Wrong member value in "events"')
 
         # There must be either a 'sub' or a 'sid', and may contain both
@@ -131,10 +122,7 @@ class LogoutToken(Message):
 
         _now = utc_time_sans_frac()
 
-        try:
-            _skew = kwargs["skew"]
-        except KeyError:
-            _skew = 0
+        _skew = kwargs.get("skew", 0)
 
         try:
             _exp = self["iat"]
@@ -168,17 +156,12 @@ class BackChannelLogoutRequest(Message):
     def verify(self, **kwargs):
         super(BackChannelLogoutRequest, self).verify(**kwargs)
 
-        args = {}
-        for arg in ID_TOKEN_VERIFY_ARGS:
-            try:
-                args[arg] = kwargs[arg]
-            except KeyError:
-                pass
+        args = {arg: kwargs[arg] for arg in ID_TOKEN_VERIFY_ARGS if arg in kwargs}
         idt = LogoutToken().from_jwt(str(self["logout_token"]), **args)
         if not idt.verify(**kwargs):
             return False
 
         self[verified_claim_name("logout_token")] = idt
-        logger.info("Verified Logout Token: {}".format(idt.to_dict()))
+        logger.info("Verified Logout Token: %s", idt)
 
         return True
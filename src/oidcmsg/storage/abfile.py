@@ -1,5 +1,6 @@
 import logging
 import os
+import stat
 import time
 from typing import Optional
 
@@ -81,7 +82,7 @@ class AbstractFileSystem(DictType):
         item = self.key_conv.serialize(item)
 
         if self.is_changed(item):
-            logger.info("File content change in {}".format(item))
+            logger.info("File content change in %s", item)
             fname = os.path.join(self.fdir, item)
             self.storage[item] = self._read_info(fname)
 
@@ -163,36 +164,35 @@ class AbstractFileSystem(DictType):
         :return: True/False
         """
         fname = os.path.join(self.fdir, item)
-        if os.path.isfile(fname):
-            mtime = self.get_mtime(fname)
+        # One stat call gives both the file type and the modification time
+        try:
+            _stat = os.stat(fname)
+        except OSError:
+            _stat = None
 
-            try:
-                _ftime = self.fmtime[item]
-            except KeyError:  # Never been seen before
-                self.fmtime[item] = mtime
-                return True
-
-            if mtime > _ftime:  # has changed
-                self.fmtime[item] = mtime
-                return True
-            else:
-                return False
-        else:
-            logger.error('Could not access {}'.format(fname))
+        if _stat is None or not stat.S_ISREG(_stat.st_mode):
+            logger.error('Could not access %s', fname)
             raise KeyError(item)
 
+        mtime = _stat.st_mtime_ns
+        if item not in self.fmtime or mtime > self.fmtime[item]:  # new or has changed
+            self.fmtime[item] = mtime
+            return True
+        else:
+            return False
+
     def _read_info(self, fname):
         if os.path.isfile(fname):
             try:
                 lock = FileLock('{}.lock'.format(fname))
-                with lock:
-                    info = open(fname, 'r').read().strip()
+                with lock, open(fname, 'r') as fp:
+                    info = fp.read().strip()
                 return self.value_conv.deserialize(info)
             except Exception as err:
                 logger.error(err)
                 raise
         else:
-            logger.error('No such file: {}'.format(fname))
+            logger.error('No such file: %s', fname)
         return None
 
     def synch(self):
@@ -219,7 +219,7 @@ class AbstractFileSystem(DictType):
                 try:
                     self.storage[f] = self._read_info(fname)
                 except Exception as err:
-                    logger.warning('Bad content in {} ({})'.format(fname, err))
+                    logger.warning('Bad content in %s (%s)', fname, err)
                 else:
                     self.fmtime[f] = mtime
 
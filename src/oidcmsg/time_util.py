@@ -292,7 +292,7 @@ def str_to_time(timestr, time_format=TIME_FORMAT):
         try:
             elem = TIME_FORMAT_WITH_FRAGMENT.match(timestr)
         except Exception as exc:
-            logger.error("Exception: %s on %s" % (exc, timestr))
+            logger.error("Exception: %s on %s", exc, timestr)
             raise
         then = time.strptime(elem.groups()[0] + "Z", TIME_FORMAT)
 
@@ -13,6 +13,7 @@ from cryptojwt.key_jar import build_keyjar
 
 from oidcmsg.exception import DecodeError
 from oidcmsg.exception import MessageException
+from oidcmsg.exception import MissingSigningKey
 from oidcmsg.exception import OidcMsgError
 from oidcmsg.message import OPTIONAL_LIST_OF_MESSAGES
 from oidcmsg.message import OPTIONAL_LIST_OF_STRINGS
@@ -519,3 +520,23 @@ def test_error_description():
 
     msg = ResponseMessage(error="foobar", error_description="abc def")
     msg.verify()
+
+
+def test_missing_signing_key_single_update():
+    class CountingKeyJar(KeyJar):
+        def __init__(self, *args, **kwargs):
+            KeyJar.__init__(self, *args, **kwargs)
+            self.updates = 0
+
+        def update(self):
+            self.updates += 1
+
+    keyjar = CountingKeyJar()
+    keyjar.add_symmetric("", "A1B2C3D4E5F6G7H8")
+
+    msg = Message(a="foo", b="bar", c="tjoho")
+    _jwt = msg.to_jwt(NEW_KEYJAR.get_signing_key("RSA", "", kid=NEW_KID), "RS256")
+    with pytest.raises(MissingSigningKey):
+        Message().from_jwt(_jwt, keyjar)
+
+    assert keyjar.updates == 1
@@ -2,6 +2,7 @@
 import json
 import os
 import sys
+import threading
 import time
 from urllib.parse import parse_qs
 from urllib.parse import urlencode
@@ -15,6 +16,7 @@ from cryptojwt.key_bundle import KeyBundle
 from cryptojwt.key_jar import KeyJar
 import pytest
 
+from oidcmsg import message
 from oidcmsg import proper_path
 from oidcmsg import time_util
 from oidcmsg.exception import MessageException
@@ -43,7 +45,9 @@ from oidcmsg.oidc import OpenIDSchema
 from oidcmsg.oidc import ProviderConfigurationResponse
 from oidcmsg.oidc import RegistrationRequest
 from oidcmsg.oidc import RegistrationResponse
+from oidcmsg.oidc import SCOPE_CHARSET
 from oidcmsg.oidc import address_deser
+from oidcmsg.oidc import check_char_set
 from oidcmsg.oidc import claims_deser
 from oidcmsg.oidc import claims_match
 from oidcmsg.oidc import claims_ser
@@ -132,6 +136,14 @@ def test_claim_not_booleans(json_param):
         OpenIDSchema().from_json(json_param)
 
 
+def test_check_char_set():
+    check_char_set("read!write", SCOPE_CHARSET)
+    with pytest.raises(NotAllowedValue):
+        check_char_set("read write", SCOPE_CHARSET)
+    with pytest.raises(NotAllowedValue):
+        check_char_set('say"cheese', SCOPE_CHARSET)
+
+
 def test_claims_deser():
     _dic = {
         "userinfo": {
@@ -1114,6 +1126,24 @@ def test_claims_match():
     assert claims_match("val", {"essential": True})
 
 
+def test_factory_concurrent_first_use():
+    message._MESSAGE_CLASS_INDEX.clear()
+    barrier = threading.Barrier(8)
+    res = []
+
+    def build():
+        barrier.wait()
+        res.extend(type(factory("AuthorizationRequest")) for _ in range(100))
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert set(res) == {AuthorizationRequest}
+
+
 def test_factory_2():
     inst = factory("ROPCAccessTokenRequest", username="me", password="text", scope="mar")
     assert isinstance(inst, ROPCAccessTokenRequest)